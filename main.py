@@ -487,6 +487,8 @@ def quantum_transform(particle: HoloiconicQuantumParticle[T, V, C]) -> Holoiconi
     hadamard = QuantumOperator(particle.hilbert_space)
     hadamard.apply_to(particle.quantum_state)
     return particle
+# Module logger for per-interaction tracing; debug calls are no-ops unless enabled.
+logger = logging.getLogger(__name__)
 class QuantumField:
     """
     Represents a quantum field capable of interacting with other fields.
@@ -506,6 +508,24 @@ class QuantumField:
         """
         angle = random.uniform(0, 2 * cmath.pi)
         return cmath.rect(1, angle)  # Unit complex number (magnitude 1)
+    @classmethod
+    def batch(cls, n: int, field_type: str, dimension: int) -> List['QuantumField']:
+        """
+        Create n fields of the same type and dimension in one pass.
+        Angles are drawn and mapped onto the unit circle in bulk, bypassing
+        per-instance __init__ and _generate_normal_vector dispatch.
+        """
+        two_pi = 2 * cmath.pi
+        rng = random.random
+        vectors = map(cmath.rect, [1] * n, [two_pi * rng() for _ in range(n)])
+        fields = []
+        for vector in vectors:
+            field_ = cls.__new__(cls)
+            field_.field_type = field_type
+            field_.dimension = dimension
+            field_.normal_vector = vector
+            fields.append(field_)
+        return fields
     def interact(self, other_field: 'QuantumField') -> Optional['QuantumField']:
         """
         Define interaction between two fields.
@@ -523,14 +543,16 @@ class QuantumField:
         """
         Fermion-Fermion annihilation: fields cancel each other out.
         """
-        print(f"Fermion-Fermion annihilation: Field {self.normal_vector} annihilates {other_field.normal_vector}")
+        logger.debug("Fermion-Fermion annihilation: Field %s annihilates %s",
+                     self.normal_vector, other_field.normal_vector)
         return None  # Fields annihilate, leaving no field
     def _pass_message(self, other_field: 'QuantumField') -> 'QuantumField':
         """
         Fermion-Boson interaction: message passing (data transmission).
         Returns a new QuantumField in a bosonic state.
         """
-        print(f"Fermion-Boson message passing: Field {self.normal_vector} communicates with {other_field.normal_vector}")
+        logger.debug("Fermion-Boson message passing: Field %s communicates with %s",
+                     self.normal_vector, other_field.normal_vector)
         # In this case, the fermion 'sends' a message to the boson endpoint.
         return QuantumField('boson', self.dimension)  # Transform into a bosonic state after interaction
 class LaplaceDomain(Generic[T]):
@@ -935,6 +957,11 @@ async def main():
         return 1
     return 0
 if __name__ == "__main__":
+    # The demo exists to show the interaction traces, which are logged at DEBUG.
+    trace_handler = logging.StreamHandler(sys.stdout)
+    trace_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(trace_handler)
+    logger.setLevel(logging.DEBUG)
     fermion1 = QuantumField('fermion', 1)
     fermion2 = QuantumField('fermion', 1)
     boson = QuantumField('boson', 1)
@@ -942,4 +969,5 @@ if __name__ == "__main__":
     fermion1.interact(fermion2)
     # Fermion-Boson interaction (message passing)
     fermion1.interact(boson)
+    logger.removeHandler(trace_handler)
     sys.exit(asyncio.run(main()))
\ No newline at end of file
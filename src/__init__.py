@@ -739,6 +739,8 @@ class EnhancedRuntimeSystem:
         self.ollama_client = OllamaClient()
         self.documents: List[Document] = []
         self.document_embeddings: Dict[str, array.array] = {}
+        # Embeddings never change once stored, so their norms are computed once.
+        self.document_norms: Dict[str, float] = {}
         self.clusters: Dict[int, List[str]] = defaultdict(list)
 
     async def add_document(self, content: str, metadata: Dict = None) -> Optional[Document]:
@@ -753,6 +755,7 @@ class EnhancedRuntimeSystem:
                     self.config.get_format_char(), 
                     embedding
                 )
+                self.document_norms[doc.uuid] = math.hypot(*self.document_embeddings[doc.uuid])
                 
                 # Assign to cluster
                 cluster_id = self._assign_to_cluster(doc.uuid)
@@ -771,13 +774,14 @@ class EnhancedRuntimeSystem:
             return 0
             
         embedding = self.document_embeddings[doc_uuid]
+        embedding_norm = self.document_norms[doc_uuid]
         best_cluster = 0
         best_similarity = -1
         
         for cluster_id, doc_uuids in self.clusters.items():
             if doc_uuids:
                 cluster_embedding = self._get_cluster_centroid(cluster_id)
-                similarity = self._cosine_similarity(embedding, cluster_embedding)
+                similarity = self._cosine_similarity(embedding, cluster_embedding, norm1=embedding_norm)
                 if similarity > best_similarity:
                     best_similarity = similarity
                     best_cluster = cluster_id
@@ -801,10 +805,18 @@ class EnhancedRuntimeSystem:
             
         return centroid
 
-    def _cosine_similarity(self, v1: array.array, v2: array.array) -> float:
-        dot_product = sum(a * b for a, b in zip(v1, v2))
-        norm1 = math.sqrt(sum(x * x for x in v1))
-        norm2 = math.sqrt(sum(x * x for x in v2))
+    def _cosine_similarity(self, v1: array.array, v2: array.array,
+                           norm1: Optional[float] = None, norm2: Optional[float] = None) -> float:
+        # sumprod/hypot do the whole reduction in C rather than a generator per term.
+        # Callers pass norms they already hold so only the dot product is recomputed.
+        if len(v1) == len(v2):
+            dot_product = math.sumprod(v1, v2)
+        else:
+            # sumprod rejects unequal lengths; keep zip's truncation for an
+            # embedding model whose size differs from config.dimensions.
+            dot_product = sum(a * b for a, b in zip(v1, v2))
+        norm1 = math.hypot(*v1) if norm1 is None else norm1
+        norm2 = math.hypot(*v2) if norm2 is None else norm2
         return dot_product / (norm1 * norm2) if norm1 > 0 and norm2 > 0 else 0.0
 
     async def _update_merkle_state(self):
@@ -888,12 +900,14 @@ class EnhancedRuntimeSystem:
                 return {'error': 'Failed to generate query embedding'}
 
             query_array = array.array(self.config.get_format_char(), query_embedding)
+            query_norm = math.hypot(*query_array)
             
             # Find similar documents
             similarities = []
             for doc in self.documents:
                 doc_embedding = self.document_embeddings[doc.uuid]
-                similarity = self._cosine_similarity(query_array, doc_embedding)
+                similarity = self._cosine_similarity(query_array, doc_embedding,
+                                                     norm1=query_norm, norm2=self.document_norms[doc.uuid])
                 similarities.append((doc, similarity))
             
             # Sort by similarity
@@ -203,8 +203,14 @@ class ModifiedQuine:
     """
     A self-reflective quine that can inspect and modify its own source code.
     """
+    # Source per class; getsource re-reads and tokenizes the file on every call.
+    _source_cache = {}
+
     def __init__(self):
-        self.source = inspect.getsource(self.__class__)
+        cls = self.__class__
+        if cls not in ModifiedQuine._source_cache:
+            ModifiedQuine._source_cache[cls] = inspect.getsource(cls)
+        self.source = ModifiedQuine._source_cache[cls]
 
     def reflect(self):
         return self.source
@@ -1,5 +1,6 @@
 from decimal import Decimal, getcontext, ROUND_HALF_EVEN
 import math, inspect, weakref
+from functools import lru_cache
 
 # Set a default precision (this can be modified at runtime)
 getcontext().prec = 28
@@ -8,30 +9,39 @@ getcontext().prec = 28
 # Minimal Complex Arithmetic with Decimal
 #############################################
 class ComplexDecimal:
+    # Operators sit in the Q/EntangledQ inner loop: keep instances slotted and
+    # build results through _make, since their parts are already Decimals.
+    __slots__ = ('real', 'imag')
+
     def __init__(self, real, imag=Decimal('0')):
         self.real = Decimal(real)
         self.imag = Decimal(imag)
+
+    @classmethod
+    def _make(cls, real, imag):
+        obj = object.__new__(cls)
+        obj.real = real
+        obj.imag = imag
+        return obj
     
     def __add__(self, other):
-        return ComplexDecimal(self.real + other.real, self.imag + other.imag)
+        return ComplexDecimal._make(self.real + other.real, self.imag + other.imag)
     
     def __sub__(self, other):
-        return ComplexDecimal(self.real - other.real, self.imag - other.imag)
+        return ComplexDecimal._make(self.real - other.real, self.imag - other.imag)
     
     def __mul__(self, other):
-        return ComplexDecimal(
-            self.real * other.real - self.imag * other.imag,
-            self.real * other.imag + self.imag * other.real
-        )
+        a, b, c, d = self.real, self.imag, other.real, other.imag
+        return ComplexDecimal._make(a * c - b * d, a * d + b * c)
     
     def conjugate(self):
-        return ComplexDecimal(self.real, -self.imag)
+        return ComplexDecimal._make(self.real, -self.imag)
     
     def __truediv__(self, other):
         # a/b = a * conj(b) / |b|^2
-        denom = other.real * other.real + other.imag * other.imag
-        num = self * other.conjugate()
-        return ComplexDecimal(num.real / denom, num.imag / denom)
+        a, b, c, d = self.real, self.imag, other.real, other.imag
+        denom = c * c + d * d
+        return ComplexDecimal._make((a * c + b * d) / denom, (b * c - a * d) / denom)
     
     def abs(self):
         return (self.real * self.real + self.imag * self.imag).sqrt()
@@ -42,41 +52,56 @@ class ComplexDecimal:
 #############################################
 # Decimal-based Trigonometric Functions (Taylor Series)
 #############################################
-def d_sin(x, terms=10):
+# π to well beyond any precision we run at; rounded to context on use.
+_PI = Decimal('3.14159265358979323846264338327950288419716939937510')
+
+@lru_cache(maxsize=None)
+def _taylor_coeffs(terms, odd, prec):
     """
-    Compute sin(x) using a Taylor series.
-    x is expected to be a Decimal (representing radians).
+    Taylor coefficients (-1)^k / n! for sin (odd=True) or cos (odd=False),
+    highest order first for Horner evaluation. Keyed on the context
+    precision since that can be changed at runtime.
     """
-    x = Decimal(x)
+    offset = 1 if odd else 0
+    coeffs = [Decimal((-1) ** k) / math.factorial(2*k + offset) for k in range(terms)]
+    return tuple(reversed(coeffs))
+
+def _horner(coeffs, x2):
     result = Decimal(0)
-    sign = Decimal(1)
-    x_power = x
-    factorial = Decimal(1)
-    for n in range(1, 2*terms, 2):
-        result += sign * x_power / factorial
-        sign *= -1
-        # Increase power: multiply by x^2
-        x_power *= x * x
-        # Increase factorial: (n+1)*(n+2)
-        factorial *= Decimal(n+1) * Decimal(n+2)
+    for c in coeffs:
+        result = result * x2 + c
     return result
 
+def _reduce(x):
+    """Reduce x to r in [-π/4, π/4] with x = r + q·π/2; returns (r, q mod 4)."""
+    half_pi = _PI / 2
+    q = int((x / half_pi).to_integral_value())
+    return x - q * half_pi, q % 4
+
+def _sin_series(r, terms):
+    return r * _horner(_taylor_coeffs(terms, True, getcontext().prec), r * r)
+
+def _cos_series(r, terms):
+    return _horner(_taylor_coeffs(terms, False, getcontext().prec), r * r)
+
+def d_sin(x, terms=10):
+    """
+    Compute sin(x) using a Taylor series.
+    x is expected to be a Decimal (representing radians). The argument is
+    reduced to [-π/4, π/4] first so the series converges quickly for any x.
+    """
+    r, q = _reduce(Decimal(x))
+    value = _sin_series(r, terms) if q % 2 == 0 else _cos_series(r, terms)
+    return value if q < 2 else -value
+
 def d_cos(x, terms=10):
     """
     Compute cos(x) using a Taylor series.
-    x is expected to be a Decimal (radians).
+    x is expected to be a Decimal (radians). Range-reduced as in d_sin.
     """
-    x = Decimal(x)
-    result = Decimal(0)
-    sign = Decimal(1)
-    x_power = Decimal(1)
-    factorial = Decimal(1)
-    for n in range(0, 2*terms, 2):
-        result += sign * x_power / factorial
-        sign *= -1
-        x_power *= x * x
-        factorial *= Decimal(n+1) * Decimal(n+2)
-    return result
+    r, q = _reduce(Decimal(x))
+    value = _cos_series(r, terms) if q % 2 == 0 else _sin_series(r, terms)
+    return value if q in (0, 3) else -value
 
 def cexp(z: ComplexDecimal) -> ComplexDecimal:
     """
@@ -134,9 +159,7 @@ class Q:
     def evolve(self):
         """Evolve the kernel by applying ψ and π, then normalize."""
         new_state = self.ψ(self.state) + self.π(self.state)
-        new_q = Q(new_state, self.ψ, self.π)
-        new_q.normalize()
-        return new_q
+        return Q(new_state, self.ψ, self.π).normalize()
 
     def __repr__(self):
         return f"Q(state={self.state}, ψ={self.ψ.__name__}, π={self.π.__name__})"
@@ -210,8 +233,14 @@ class ModifiedQuine:
     """
     A self-reflective quine that can inspect and modify its own source code.
     """
+    # Source per class; getsource re-reads and tokenizes the file on every call.
+    _source_cache = {}
+
     def __init__(self):
-        self.source = inspect.getsource(self.__class__)
+        cls = self.__class__
+        if cls not in ModifiedQuine._source_cache:
+            ModifiedQuine._source_cache[cls] = inspect.getsource(cls)
+        self.source = ModifiedQuine._source_cache[cls]
 
     def reflect(self):
         return self.source
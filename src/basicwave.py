@@ -6,6 +6,7 @@ class Ψ:
     def __init__(self, f): 
         """Initialize with a function f(x)."""
         self.f = f  
+        self._norm_cache = None  # L2 norm over the grid, filled by normalize()
 
     def __call__(self, x):  
         """Evaluate wavefunction at x.""" 
@@ -25,7 +26,9 @@ class Ψ:
 
     def normalize(self):
         """Normalization operation (ensuring unit integral if interpreted as probability density)."""
-        norm = sum(abs(self.f(x))**2 for x in range(-100, 100))**0.5
+        if self._norm_cache is None:
+            self._norm_cache = sum(abs(self.f(x))**2 for x in range(-100, 100))**0.5
+        norm = self._norm_cache
         return Ψ(lambda x: self.f(x) / norm if norm else 0)
 
 class Ψ_1(Ψ):
@@ -1,14 +1,25 @@
+import os
+import re
 import sys
+import fnmatch
 import importlib.util
 from pathlib import Path
 import mimetypes
 import hashlib
 import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
+from functools import lru_cache
 import json
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+try:
+    # Optional: C serializer, several times faster than json for large exports.
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass(slots=True)
 class FileMetadata:
     path: str
     size: int
@@ -24,18 +35,130 @@ class FileMetadata:
     symlinks: list[Path] = None
     content: Optional[str] = None
 
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns(patterns: tuple) -> Callable[[Path], bool]:
+    """
+    Build a predicate equivalent to any(path.match(p) for p in patterns).
+    Single-component globs (the usual case) only ever match the final name, so
+    they are folded into one compiled regex; patterns containing a separator
+    keep Path.match semantics.
+    """
+    name_patterns = [p for p in patterns if '/' not in p and os.sep not in p]
+    path_patterns = [p for p in patterns if p not in name_patterns]
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    name_re = re.compile('|'.join(map(fnmatch.translate, name_patterns)), flags) if name_patterns else None
+
+    def is_ignored(path: Path) -> bool:
+        if name_re is not None and name_re.match(path.name):
+            return True
+        return any(path.match(p) for p in path_patterns)
+    return is_ignored
+
+def _list_symlinks(directory: Path) -> list[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_symlink()]
+    except OSError:
+        return []
+
+def _guess_mime(table: Dict[str, str], path: Path) -> str:
+    """
+    mimetypes.guess_type memoized per suffix in table. The answer depends only
+    on the suffix, except for compression suffixes (.gz etc.) where the inner
+    suffix decides, so those are always looked up in full.
+    """
+    suffix = path.suffix
+    mime = table.get(suffix)
+    if mime is None:
+        mime = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if suffix not in mimetypes.encodings_map:
+            table[suffix] = mime
+    return mime
+
+def _dumps_json(obj: Any) -> bytes:
+    """Compact JSON as bytes, via orjson when installed. Paths serialize as str."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+def _write_json_object(output_path: Path, items) -> None:
+    """
+    Stream (key, value) pairs to output_path as one JSON object, one entry per
+    line, so neither the full dict nor the full document is held in memory.
+    """
+    with open(output_path, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(items):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(_dumps_json(str(key)))
+            f.write(b': ')
+            f.write(_dumps_json(value))
+        f.write(b'\n}\n')
+
+class _HashCache:
+    """
+    sha256 digests keyed on (path, st_dev, st_ino, st_mtime_ns, st_size) so
+    re-scans only hash files that actually changed. The path is part of the
+    key because DirEntry.stat() leaves st_dev/st_ino at 0 on Windows. save()
+    keeps only the keys looked up since the last save, and writes them to disk
+    only when persist is set (the default root may be read-only).
+    """
+    FILENAME = '.fsmem_cache.json'
+
+    def __init__(self, root_dir: Path, persist: bool = False):
+        self.path = root_dir / self.FILENAME
+        self.persist = persist
+        self._entries: Dict[tuple, str] = self._load() if persist else {}
+        self._seen: set = set()
+
+    def _load(self) -> Dict[tuple, str]:
+        try:
+            rows = json.loads(self.path.read_text(encoding='utf-8'))
+            return {(path, *map(int, stat_key)): digest for path, *stat_key, digest in rows}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def digest(self, file_path: Path, stat: os.stat_result) -> str:
+        key = (str(file_path), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        self._seen.add(key)
+        digest = self._entries.get(key)
+        if digest is None:
+            with open(file_path, 'rb') as f:
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            self._entries[key] = digest
+        return digest
+
+    def save(self):
+        self._entries = {key: self._entries[key] for key in self._seen if key in self._entries}
+        self._seen = set()
+        if not self.persist:
+            return
+        rows = [[*key, digest] for key, digest in self._entries.items()]
+        try:
+            self.path.write_text(json.dumps(rows), encoding='utf-8')
+        except OSError as e:
+            print(f"Could not write hash cache {self.path}: {e}")
+
 class FilesystemMemory:
-    def __init__(self, root_dir: Optional[Path] = None):
+    HASH_CACHE_NAME = _HashCache.FILENAME
+
+    def __init__(self, root_dir: Optional[Path] = None, persist_hash_cache: bool = False):
         self.root_dir = root_dir or Path(__file__).resolve().parent
         self.loaded_modules: Dict[str, Any] = {}
         self.file_metadata: Dict[str, FileMetadata] = {}
+        self._hash_cache = _HashCache(self.root_dir, persist_hash_cache)
+        self._symlink_index: Dict[Path, list[Path]] = {}
+        # Text is read on demand via get_content rather than held on every
+        # FileMetadata, so a scan costs metadata-sized memory only.
+        self._read_content = lru_cache(maxsize=128)(self._load_text_content)
+        self._module_cache: Dict[tuple, Any] = {}
+        self._mime_table: Dict[str, str] = {}
+
+    def save_hash_cache(self):
+        self._hash_cache.save()
         
-    def _generate_file_hash(self, file_path: Path) -> str:
-        hasher = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+    def _generate_file_hash(self, file_path: Path, stat: Optional[os.stat_result] = None) -> str:
+        return self._hash_cache.digest(file_path, stat or file_path.stat())
     
     def _load_text_content(self, path: Path) -> Optional[str]:
         """Load the text content of a file."""
@@ -44,10 +167,28 @@ class FilesystemMemory:
         except UnicodeDecodeError:
             return None
 
-    def _extract_file_metadata(self, file_path: Path) -> FileMetadata:
-        """Extract metadata from a file."""
-        stat = file_path.stat()
-        mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+    def get_content(self, path) -> Optional[str]:
+        """Text content of a file, loaded lazily; None for non-text files."""
+        metadata = self.file_metadata.get(str(path))
+        if metadata is not None and not metadata.is_text:
+            return None
+        return self._read_content(Path(path))
+
+    def _symlinks_for(self, file_path: Path) -> list[Path]:
+        """
+        Symlinks beside file_path whose name contains its name (what the old
+        per-file `parent.glob(f'*{name}*')` found). Each directory is listed
+        once per scan instead of once per file.
+        """
+        links = self._symlink_index.get(file_path.parent)
+        if links is None:
+            links = self._symlink_index[file_path.parent] = _list_symlinks(file_path.parent)
+        return [p for p in links if file_path.name in p.name]
+
+    def _extract_file_metadata(self, file_path: Path, stat: Optional[os.stat_result] = None) -> FileMetadata:
+        """Extract metadata from a file; pass stat when the caller already has it."""
+        stat = stat or file_path.stat()
+        mime_type = _guess_mime(self._mime_table, file_path)
         
         return FileMetadata(
             path=str(file_path),
@@ -56,13 +197,12 @@ class FilesystemMemory:
             encoding='utf-8',  # Assuming UTF-8 for text files
             suffix=file_path.suffix,
             mime_type=mime_type,
-            hash=self._generate_file_hash(file_path),
+            hash=self._generate_file_hash(file_path, stat),
             is_text='text' in mime_type,
             name=file_path.name,
             stem=file_path.stem,
             created=stat.st_ctime,
-            symlinks=[p for p in file_path.parent.glob(f'*{file_path.name}*') if p.is_symlink()],
-            content=self._load_text_content(file_path) if 'text' in mime_type else None
+            symlinks=self._symlinks_for(file_path),
         )
 
     def load_module_from_file(self, file_path: Path) -> Optional[Any]:
@@ -79,42 +219,104 @@ class FilesystemMemory:
             print(f"Error loading module from {file_path}: {e}")
             return None
     
-    def scan_filesystem(self, ignore_patterns: Optional[list] = None):
+    def get_module(self, file_path: Path) -> Optional[Any]:
+        """
+        Load the module for a .py file, reusing the previous load when the
+        file's content hash is unchanged so it is not executed again.
+        """
+        if file_path.suffix != '.py':
+            return None
+        metadata = self.file_metadata.get(str(file_path))
+        key = (str(file_path), metadata.hash if metadata else self._generate_file_hash(file_path))
+        module = self._module_cache.get(key)
+        if module is None:
+            module = self.load_module_from_file(file_path)
+            if module:
+                self._module_cache[key] = module
+        return module
+
+    @staticmethod
+    def _walk_files(root: Path):
+        """
+        Yield a DirEntry for every file under root using an explicit os.scandir
+        stack. Like rglob, directory symlinks are not followed; file symlinks
+        are included. DirEntry caches its type and stat, so each file costs at
+        most one stat call.
+        """
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+
+    def scan_filesystem(self, ignore_patterns: Optional[list] = None, load_modules: bool = False):
+        """
+        Record metadata for every file under root_dir. Executing .py files is
+        opt-in (load_modules=True) since it runs arbitrary top-level code;
+        otherwise use get_module on the files you need.
+        """
         ignore_patterns = ignore_patterns or [
             '.git', '__pycache__', 'venv', '.env', 
-            '*.pyc', '*.log', '*.tmp'
+            '*.pyc', '*.log', '*.tmp', self.HASH_CACHE_NAME
         ]
         
-        for file_path in self.root_dir.rglob('*'):
-            if file_path.is_file():
-                if any(file_path.match(pattern) for pattern in ignore_patterns):
-                    continue
-                
-                metadata = self._extract_file_metadata(file_path)
+        is_ignored = _compile_ignore_patterns(tuple(ignore_patterns))
+        self._symlink_index = {}
+        # Cached text may predate edits this scan picks up.
+        self._read_content.cache_clear()
+        file_paths, stats = [], []
+        for entry in self._walk_files(self.root_dir):
+            file_path = Path(entry.path)
+            if not is_ignored(file_path):
+                file_paths.append(file_path)
+                stats.append(entry.stat())
+        
+        # stat/hash/read block on disk and hashing releases the GIL, so extract
+        # metadata concurrently.
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            for file_path, metadata in zip(file_paths, executor.map(self._extract_file_metadata, file_paths, stats)):
                 self.file_metadata[str(file_path)] = metadata
-                
-                module = self.load_module_from_file(file_path)
-                if module:
-                    module_name = f"{file_path.stem}_module"
-                    self.loaded_modules[module_name] = module
+        self.save_hash_cache()
+        
+        if not load_modules:
+            return
+        # exec_module has side effects, so modules are still loaded one at a
+        # time on the calling thread.
+        for file_path in file_paths:
+            module = self.get_module(file_path)
+            if module:
+                module_name = f"{file_path.stem}_module"
+                self.loaded_modules[module_name] = module
     
-    def export_metadata(self, output_path: Optional[Path] = None) -> Dict[str, Any]:
-        metadata_dict = {
+    def export_metadata(self, output_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """
+        With output_path, stream the metadata to disk entry by entry and
+        return None; without it, return the metadata as a dict.
+        """
+        if output_path:
+            _write_json_object(output_path, (
+                (path, asdict(metadata)) for path, metadata in self.file_metadata.items()
+            ))
+            return None
+        return {
             path: asdict(metadata) 
             for path, metadata in self.file_metadata.items()
         }
-        
-        if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(metadata_dict, f, indent=2)
-        
-        return metadata_dict
 
 class ContentRegistry:
-    def __init__(self, root_dir: Path):
+    def __init__(self, root_dir: Path, persist_hash_cache: bool = False):
         self.root_dir = root_dir
         self.metadata: Dict[str, FileMetadata] = {}
         self.modules: Dict[str, Any] = {}
+        self._symlink_index: Dict[Path, list[Path]] = {}
+        self._mime_table: Dict[str, str] = {}
+        self._hash_cache = _HashCache(root_dir, persist_hash_cache)
         self._init_mimetypes()
 
     def _init_mimetypes(self):
@@ -122,19 +324,20 @@ class ContentRegistry:
         mimetypes.add_type('text/plain', '.txt')
         mimetypes.add_type('application/python', '.py')
 
-    def _compute_hash(self, path: Path) -> str:
-        hasher = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b''):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+    def _compute_hash(self, path: Path, stat: Optional[os.stat_result] = None) -> str:
+        return self._hash_cache.digest(path, stat or path.stat())
+
+    def _symlinks_in(self, directory: Path) -> list[Path]:
+        if directory not in self._symlink_index:
+            self._symlink_index[directory] = _list_symlinks(directory)
+        return self._symlink_index[directory]
 
     def register_file(self, path: Path) -> Optional[FileMetadata]:
         if not path.is_file():
             return None
 
         stat = path.stat()
-        mime_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        mime_type = _guess_mime(self._mime_table, path)
         
         metadata = FileMetadata(
             path=path,
@@ -142,9 +345,8 @@ class ContentRegistry:
             size=stat.st_size,
             created=stat.st_ctime,
             modified=stat.st_mtime,
-            hash=self._compute_hash(path),
-            symlinks=[p for p in path.parent.glob(f'*{path.name}*') if p.is_symlink()],
-            content=self._load_text_content(path) if 'text' in mime_type else None
+            hash=self._compute_hash(path, stat),
+            symlinks=[p for p in self._symlinks_in(path.parent) if path.name in p.name],
         )
         
         rel_path = path.relative_to(self.root_dir)
@@ -163,13 +365,15 @@ class ContentRegistry:
         return metadata
 
     def scan_directory(self):
+        self._symlink_index = {}
         for path in self.root_dir.rglob('*'):
-            if path.is_file():
+            if path.is_file() and path.name != _HashCache.FILENAME:
                 self.register_file(path)
+        self._hash_cache.save()
 
     def export_metadata(self, output_path: Path):
-        metadata_dict = {
-            str(k): {
+        _write_json_object(output_path, (
+            (k, {
                 'path': str(v.path),
                 'mime_type': v.mime_type,
                 'size': v.size,
@@ -177,11 +381,10 @@ class ContentRegistry:
                 'modified': datetime.fromtimestamp(v.modified).isoformat(),
                 'hash': v.hash,
                 'symlinks': [str(s) for s in (v.symlinks or [])],
-                'has_content': v.content is not None
-            }
+                'has_content': 'text' in v.mime_type
+            })
             for k, v in self.metadata.items()
-        }
-        output_path.write_text(json.dumps(metadata_dict, indent=2))
+        ))
 
     def create_module(self, metadata: FileMetadata) -> str:
         rel_path = metadata.path.relative_to(self.root_dir)
@@ -202,7 +405,7 @@ Hash: {metadata.hash}
 CONTENT = """{content}"""
 
 def get_metadata():
-    return {metadata.__dict__}
+    return {asdict(metadata)}
 
 @lambda _: _()
 def init():
@@ -213,18 +416,18 @@ def init():
 
 def main():
     fs_memory = FilesystemMemory()
-    fs_memory.scan_filesystem()
-    metadata = fs_memory.export_metadata(
+    fs_memory.scan_filesystem(load_modules=True)
+    fs_memory.export_metadata(
         Path(__file__).parent / 'filesystem_metadata.json'
     )
     
-    print(f"Total files scanned: {len(metadata)}")
+    print(f"Total files scanned: {len(fs_memory.file_metadata)}")
     print(f"Modules loaded: {len(fs_memory.loaded_modules)}")
     print("File metadata exported to 'filesystem_metadata.json'")
     
-    for file_path, meta in list(metadata.items())[:5]:
+    for file_path, meta in list(fs_memory.file_metadata.items())[:5]:
         print(f"\nFile: {file_path}")
-        print(json.dumps(meta, indent=2))
+        print(json.dumps(asdict(meta), indent=2, default=str))
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,8 @@
 from decimal import Decimal, getcontext
+import sys
 import math
+import cmath
+from functools import lru_cache
 
 getcontext().prec = 28  # High precision for stability
 
@@ -53,6 +56,11 @@ class Q:
 
     def normalize(self):
         """Normalize state to a unit cycle with slight adaptive energy loss."""
+        if isinstance(self.state, complex):
+            norm = abs(self.state)
+            if norm > 0:
+                self.state /= norm
+            return self
         norm = self.state.abs()
         if norm > 0:
             self.state = ComplexDecimal(self.state.real / norm, self.state.imag / norm)
@@ -74,55 +82,83 @@ def novel(x: ComplexDecimal) -> ComplexDecimal:
     """
     Introduces an oscillatory perturbation using a rotational factor.
     """
+    return x * _rotation(getcontext().prec)
+
+@lru_cache(maxsize=None)
+def _rotation(prec):
+    """e^(iθ) for the fixed θ = 0.1, computed once per context precision."""
     angle = Decimal('0.1')  # Small rotation factor
-    rot = ComplexDecimal(d_cos(angle), d_sin(angle))  # e^(iθ)
-    return x * rot
+    return ComplexDecimal(d_cos(angle), d_sin(angle))
 
 #############################################
 # π (Momentum) - Nonlinear Damping
 #############################################
+# Built once: Decimal construction from strings is costly on a per-step path.
+_DAMP_BASE = Decimal('0.98')
+_DAMP_GAIN = Decimal('0.02')
+
 def inertia(x: ComplexDecimal) -> ComplexDecimal:
     """
     Applies non-linear damping to stabilize limit cycle behavior.
     """
     entropy = x.abs()  # Proxy for information density
-    scaling = Decimal('0.98') + Decimal('0.02') * entropy  # Soft damping
+    scaling = _DAMP_BASE + _DAMP_GAIN * entropy  # Soft damping
     return ComplexDecimal(x.real * scaling, x.imag * scaling)
 
+#############################################
+# Native complex ψ and π
+#############################################
+# Every step renormalizes onto the unit circle, so rounding error does not
+# accumulate and float precision is enough; these run an order of magnitude
+# faster than the Decimal versions above.
+_ROT_FLOAT = cmath.rect(1, 0.1)
+
+def novel_float(x: complex) -> complex:
+    return x * _ROT_FLOAT
+
+def inertia_float(x: complex) -> complex:
+    return x * (0.98 + 0.02 * abs(x))
+
+def make_q(decimal_mode: bool = True) -> Q:
+    """Q seeded at 1+0i; decimal_mode=False evolves a native complex instead."""
+    if decimal_mode:
+        return Q(ComplexDecimal('1', '0'), novel, inertia)
+    return Q(1 + 0j, novel_float, inertia_float)
+
 #############################################
 # Decimal-Based Trig Functions (Taylor Series)
 #############################################
+_ZERO = Decimal(0)
+
+@lru_cache(maxsize=None)
+def _taylor_coeffs(terms, odd, prec):
+    """
+    (-1)^k / n! for sin (odd=True) or cos (odd=False), highest order first
+    for Horner evaluation; keyed on precision since it can change at runtime.
+    """
+    offset = 1 if odd else 0
+    coeffs = [Decimal((-1) ** k) / math.factorial(2*k + offset) for k in range(terms)]
+    return tuple(reversed(coeffs))
+
+def _horner(coeffs, x2):
+    result = _ZERO
+    for c in coeffs:
+        result = result * x2 + c
+    return result
+
 def d_sin(x, terms=10):
     x = Decimal(x)
-    result = Decimal(0)
-    sign = Decimal(1)
-    x_power = x
-    factorial = Decimal(1)
-    for n in range(1, 2*terms, 2):
-        result += sign * x_power / factorial
-        sign *= -1
-        x_power *= x * x
-        factorial *= Decimal(n+1) * Decimal(n+2)
-    return result
+    return x * _horner(_taylor_coeffs(terms, True, getcontext().prec), x * x)
 
 def d_cos(x, terms=10):
     x = Decimal(x)
-    result = Decimal(0)
-    sign = Decimal(1)
-    x_power = Decimal(1)
-    factorial = Decimal(1)
-    for n in range(0, 2*terms, 2):
-        result += sign * x_power / factorial
-        sign *= -1
-        x_power *= x * x
-        factorial *= Decimal(n+1) * Decimal(n+2)
-    return result
+    return _horner(_taylor_coeffs(terms, False, getcontext().prec), x * x)
 
 #############################################
 # Run the System: Observe Limit Cycles
 #############################################
 if __name__ == "__main__":
-    q = Q(ComplexDecimal('1', '0'), novel, inertia)
+    q = make_q(decimal_mode='--float' not in sys.argv)
 
     print("Initial Q state:")
     print(q)
@@ -1,35 +1,56 @@
 import sys
 import os
+import asyncio
 import hashlib
 import importlib.util
 import logging
 import inspect
-from types import ModuleType
-from typing import Dict, Set, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor
+from types import FunctionType, ModuleType
+from typing import Dict, Set, Any, Optional, Callable, Tuple
+from collections import defaultdict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # Optional: much faster than sha256 for dedup fingerprints.
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class ModularSystem:
-    def __init__(self, hash_algorithm: str = 'sha256'):
-        self.hash_algorithm = hash_algorithm
+    def __init__(self, hash_algorithm: Optional[str] = None):
+        # Hashes are only content fingerprints, so default to BLAKE3 when the
+        # package is installed; pass 'sha256' explicitly when it must be SHA-2.
+        self.hash_algorithm = hash_algorithm or ('blake3' if blake3 is not None else 'sha256')
         self.modules: Dict[str, ModuleType] = {}
+        self._hasher_ctor = self._resolve_hasher(self.hash_algorithm)
 
-    def _get_hasher(self):
+    @staticmethod
+    def _resolve_hasher(name: str) -> Callable[[], Any]:
+        """
+        Resolve the hash constructor once, so per-file hashing calls e.g.
+        hashlib.sha256 directly instead of going through hashlib.new's lookup.
+        """
+        if name == 'blake3':
+            if blake3 is None:
+                raise ValueError("Hash algorithm 'blake3' requires the blake3 package")
+            return blake3
+        if name in hashlib.algorithms_guaranteed and hasattr(hashlib, name):
+            return getattr(hashlib, name)
         try:
-            return hashlib.new(self.hash_algorithm)
+            hashlib.new(name)
         except ValueError:
-            raise ValueError(f"Unsupported hash algorithm: {self.hash_algorithm}")
+            raise ValueError(f"Unsupported hash algorithm: {name}")
+        return partial(hashlib.new, name)
 
     def get_file_metadata(self, filepath: str) -> Dict[str, Any]:
         try:
             stat = os.stat(filepath)
             with open(filepath, 'rb') as f:
-                content = f.read()
-
-            hasher = self._get_hasher()
-            hasher.update(content)
+                hasher = hashlib.file_digest(f, self._hasher_ctor)
 
             return {
                 "path": filepath,
@@ -44,35 +65,102 @@ class ModularSystem:
             logging.error(f"Error accessing file {filepath}: {e}")
             return {"path": filepath, "error": str(e)}
 
-    def find_file_groups(self, base_path: str, max_depth: int = 2, file_filter: Optional[Callable[[str], bool]] = None) -> Dict[str, Set[str]]:
-        groups: Dict[str, Set[str]] = {}
+    def _iter_files(self, path: str, max_depth: int, file_filter: Callable[[str], bool], depth: int = 0):
+        """
+        Yield (filepath, size) for filtered files, recursing with os.scandir.
+        DirEntry type checks need no extra stat, and directories deeper than
+        max_depth are never opened.
+        """
+        try:
+            with os.scandir(path) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file() and file_filter(entry.name):
+                            yield entry.path, entry.stat().st_size
+                    except OSError as e:
+                        logging.warning(f"Could not process file {entry.path}: {e}")
+        except OSError as e:
+            logging.warning(f"Could not scan directory {path}: {e}")
+            return
+        if depth < max_depth:
+            for subdir in subdirs:
+                yield from self._iter_files(subdir, max_depth, file_filter, depth + 1)
+
+    def _hash_file(self, filepath: str) -> Optional[Tuple[str, str]]:
+        try:
+            # file_digest streams through a C-level buffer instead of
+            # materializing the whole file as a bytes object.
+            with open(filepath, 'rb') as f:
+                return hashlib.file_digest(f, self._hasher_ctor).hexdigest(), filepath
+        except (PermissionError, IsADirectoryError, OSError) as e:
+            logging.warning(f"Could not process file {filepath}: {e}")
+            return None
+
+    def _bucket_by_size(self, base_path: str, max_depth: int, file_filter: Optional[Callable[[str], bool]], groups: Dict[str, Set[str]], hash_unique_sizes: bool) -> list:
+        """
+        Bucket filtered files by size. Files whose size no other file shares
+        cannot have a duplicate, so they go straight into groups as singletons
+        keyed 'size:<bytes>' (unless hash_unique_sizes). Returns the paths that
+        still need hashing.
+        """
         file_filter = file_filter or (lambda x: x.endswith(('.py',)))
-        def process_file(root, file):
-            filepath = os.path.join(root, file)
-            try:
-                with open(filepath, 'rb') as f:
-                    content = f.read()
-                    hasher = self._get_hasher()
-                    hasher.update(content)
-                    hash_code = hasher.hexdigest()
-                if hash_code not in groups:
-                    groups[hash_code] = set()
-                groups[hash_code].add(filepath)
-            except (PermissionError, IsADirectoryError, OSError) as e:
-                logging.warning(f"Could not process file {filepath}: {e}")
+        size_map: Dict[int, list] = defaultdict(list)
+        for filepath, size in self._iter_files(base_path, max_depth, file_filter):
+            size_map[size].append(filepath)
+        to_hash = []
+        for size, paths in size_map.items():
+            if len(paths) == 1 and not hash_unique_sizes:
+                groups[f"size:{size}"] = {paths[0]}
+            else:
+                to_hash.extend(paths)
+        return to_hash
 
+    def find_file_groups(self, base_path: str, max_depth: int = 2, file_filter: Optional[Callable[[str], bool]] = None, hash_unique_sizes: bool = False) -> Dict[str, Set[str]]:
+        """
+        Group files under base_path by content hash.
+        Files are bucketed by size first; a file whose size no other file shares
+        cannot have a duplicate, so it is not read and is returned as a singleton
+        group keyed 'size:<bytes>' (pass hash_unique_sizes=True to hash it anyway).
+        """
+        groups: Dict[str, Set[str]] = {}
+        to_hash = self._bucket_by_size(base_path, max_depth, file_filter, groups, hash_unique_sizes)
+        # Workers only hash; groups is populated here on the calling thread.
         with ThreadPoolExecutor(max_workers=4) as executor:
-            for root, _, files in os.walk(base_path):
-                depth = root[len(base_path):].count(os.sep)
-                if depth > max_depth:
-                    continue
-                for file in files:
-                    if file_filter(file):
-                        executor.submit(process_file, root, file)
+            futures = [executor.submit(self._hash_file, filepath) for filepath in to_hash]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    hash_code, filepath = result
+                    groups.setdefault(hash_code, set()).add(filepath)
+
+        return groups
+
+    async def find_file_groups_async(self, base_path: str, max_depth: int = 2, file_filter: Optional[Callable[[str], bool]] = None, hash_unique_sizes: bool = False, concurrency: int = 16) -> Dict[str, Set[str]]:
+        """
+        asyncio variant of find_file_groups. The walk and each hash run in the
+        loop's default executor, with at most `concurrency` hashes in flight.
+        """
+        loop = asyncio.get_running_loop()
+        groups: Dict[str, Set[str]] = {}
+        to_hash = await loop.run_in_executor(
+            None, self._bucket_by_size, base_path, max_depth, file_filter, groups, hash_unique_sizes
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def hash_one(filepath):
+            async with semaphore:
+                return await loop.run_in_executor(None, self._hash_file, filepath)
 
+        for result in await asyncio.gather(*(hash_one(filepath) for filepath in to_hash)):
+            if result is not None:
+                hash_code, filepath = result
+                groups.setdefault(hash_code, set()).add(filepath)
         return groups
 
-    def inspect_module(self, module_name: str) -> Optional[Dict[str, Any]]:
+    def inspect_module(self, module_name: str, with_signatures: bool = True) -> Optional[Dict[str, Any]]:
         try:
             module = importlib.import_module(module_name)
             module_info = {
@@ -83,16 +171,18 @@ class ModularSystem:
                 "functions": {},
                 "classes": {}
             }
-            for name, obj in inspect.getmembers(module):
+            # Walk the namespace directly: getmembers getattr()s and sorts every
+            # member, and signature() is only computed when asked for.
+            for name, obj in vars(module).items():
                 if name.startswith('_'):
                     continue
                 try:
-                    if inspect.isfunction(obj):
+                    if type(obj) is FunctionType:
                         module_info['functions'][name] = {
-                            "signature": str(inspect.signature(obj)),
+                            "signature": str(inspect.signature(obj)) if with_signatures else None,
                             "doc": obj.__doc__
                         }
-                    elif inspect.isclass(obj):
+                    elif isinstance(obj, type):
                         module_info['classes'][name] = {
                             "methods": [m for m in dir(obj) if not m.startswith('_')],
                             "doc": obj.__doc__
@@ -137,7 +227,7 @@ class ModularSystem:
 
         logging.info("\n2. Module Inspection Example:")
         module_name = 'json'
-        module_details = self.inspect_module(module_name)
+        module_details = self.inspect_module(module_name, with_signatures=False)
         if module_details and 'error' in module_details:
             logging.error(f"Inspection Error: {module_details['error']}")
         else: